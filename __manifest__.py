@@ -10,6 +10,9 @@
         and generate PDF reports.
     """,
     'depends': ['base'],
+    'external_dependencies': {
+        'python': ['weasyprint', 'pandas'],
+    },
     'data': [
         'security/ir.model.access.csv',
         'views/student.xml',
@@ -1,11 +1,10 @@
-import pandas as pd
-import base64
-from io import BytesIO
-from xhtml2pdf import pisa
 from odoo import models, fields, api
 from odoo.exceptions import UserError
 
 
+GENDER_SELECTION = [('male', 'Male'), ('female', 'Female')]
+
+
 # -------------------------------------------------------------------
 # Student Model
 # -------------------------------------------------------------------
@@ -26,7 +25,8 @@ class Student(models.Model):
     department_id = fields.Many2one(
         comodel_name='department',
         string='Department',
-        required=True
+        required=True,
+        index=True,
     )
 
     about_education = fields.One2many(
@@ -40,7 +40,7 @@ class Student(models.Model):
     percentage = fields.Float(string='Percentage', compute='compute_percentage', store=True)
 
     gender = fields.Selection(
-        [('male', 'Male'), ('female', 'Female')],
+        GENDER_SELECTION,
         string='Gender',
     )
 
@@ -50,10 +50,8 @@ class Student(models.Model):
     @api.depends('total_marks', 'obtained_marks')
     def compute_percentage(self):
         for record in self:
-            if record.total_marks > 0:
-                record.percentage = (record.obtained_marks / record.total_marks) * 100
-            else:
-                record.percentage = 0
+            total = record.total_marks
+            record.percentage = (record.obtained_marks / total) * 100 if total > 0 else 0
 
     # -----------------------------
     # Actions
@@ -161,14 +159,20 @@ class Department(models.Model):
     _description = 'Department Information'
 
     name = fields.Char(string='Department Name', required=True)
+    student_ids = fields.One2many(
+        comodel_name='student',
+        inverse_name='department_id',
+        string='Students'
+    )
 
     @api.model
     def init(self):
         """Initialize default departments"""
         department_names = ['MATH', 'BSCS', 'PHYSICS', 'BBA', 'COMMERCE', 'ALL']
-        for name in department_names:
-            if not self.search([('name', '=', name)], limit=1):
-                self.create({'name': name})
+        existing = set(self.search([('name', 'in', department_names)]).mapped('name'))
+        to_create = [{'name': name} for name in department_names if name not in existing]
+        if to_create:
+            self.create(to_create)
 
 
 # -------------------------------------------------------------------
@@ -184,9 +188,10 @@ class Institute(models.Model):
     def init(self):
         """Initialize default institutes"""
         institute_names = ['Superior', 'Aspire', 'Degree', 'GUCF', 'Punjab']
-        for name in institute_names:
-            if not self.search([('name', '=', name)], limit=1):
-                self.create({'name': name})
+        existing = set(self.search([('name', 'in', institute_names)]).mapped('name'))
+        to_create = [{'name': name} for name in institute_names if name not in existing]
+        if to_create:
+            self.create(to_create)
 
 
 # -------------------------------------------------------------------
@@ -202,6 +207,7 @@ class Degree(models.Model):
     def init(self):
         """Initialize default degrees"""
         degree_names = ['Matric', 'FSc', 'BSc', 'MPhil']
-        for name in degree_names:
-            if not self.search([('name', '=', name)], limit=1):
-                self.create({'name': name})
+        existing = set(self.search([('name', 'in', degree_names)]).mapped('name'))
+        to_create = [{'name': name} for name in degree_names if name not in existing]
+        if to_create:
+            self.create(to_create)
@@ -1,9 +1,258 @@
-import base64
-from io import BytesIO
-import pandas as pd
-from xhtml2pdf import pisa
-from odoo import models, api
+from datetime import timedelta
+from functools import lru_cache
+from html import escape
+from odoo import models, fields, api
 from odoo.exceptions import UserError
+from odoo.tools.pdf import merge_pdf
+from ..models.stud import GENDER_SELECTION
+
+
+_GENDER_MAP = dict(GENDER_SELECTION)
+
+_DEPARTMENT_REPORT_CSS = """
+    body {
+        font-family: Arial, sans-serif;
+        padding: 20px;
+    }
+    .report-title {
+        text-align: center;
+        font-size: 22px;
+        font-weight: bold;
+        margin-bottom: 15px;
+        color: #2a2a2a;
+    }
+    .department-title {
+        background-color: #555;
+        color: white;
+        padding: 8px;
+        font-size: 16px;
+        border-radius: 4px;
+        margin-top: 20px;
+        margin-bottom: 10px;
+    }
+    .student-table {
+        width: 100%;
+        border-collapse: collapse;
+        margin-bottom: 20px;
+    }
+    .student-table th, .student-table td {
+        border: 1px solid #bbb;
+        padding: 8px;
+        text-align: center;
+        font-size: 12px;
+        min-width: 80px;
+    }
+    .student-table th {
+        background-color: #333;
+        color: white;
+        font-weight: bold;
+    }
+    .student-table td {
+        background-color: #f9f9f9;
+    }
+    .no-data {
+        text-align: center;
+        color: #666;
+        font-style: italic;
+        padding: 20px;
+        background-color: #f0f0f0;
+        border: 1px solid #ddd;
+    }
+    .empty-row td {
+        background-color: #fff;
+        color: #999;
+        font-style: italic;
+    }
+"""
+
+_STUDENT_REPORT_CSS = """
+    body {
+        font-family: Arial, sans-serif;
+        background-color: #f9f9f9;
+        margin: 20px;
+    }
+    .report-header {
+        text-align: center;
+        background-color: #4a4a4a;
+        color: white;
+        padding: 15px;
+        border-radius: 8px;
+        margin-bottom: 20px;
+    }
+    .section-title {
+        color: #333;
+        border-bottom: 2px solid #ddd;
+        margin-top: 30px;
+        padding-bottom: 5px;
+    }
+    .data-table {
+        width: 100%;
+        border-collapse: collapse;
+        background-color: white;
+        margin-bottom: 20px;
+        box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+    }
+    .data-table th, .data-table td {
+        border: 1px solid #ddd;
+        padding: 12px;
+        text-align: left;
+    }
+    .data-table th {
+        background-color: #4a4a4a;
+        color: white;
+        font-weight: bold;
+    }
+    .data-table td {
+        background-color: #fafafa;
+    }
+    .no-data {
+        text-align: center;
+        color: #666;
+        font-style: italic;
+        padding: 20px;
+        background-color: #f0f0f0;
+        border: 1px solid #ddd;
+    }
+    .empty-row td {
+        background-color: #fff;
+        color: #999;
+        font-style: italic;
+        text-align: center;
+    }
+"""
+
+# Stylesheets are handed to WeasyPrint pre-parsed (see _stylesheet) instead
+# of being inlined, so every report document shares the same bare shell.
+_REPORT_HEAD = "<html><body>"
+_DEPARTMENT_REPORT_TITLE = "<div class='report-title'>Department Report - {dept_name}</div>"
+_STUDENT_REPORT_TITLE = "<div class='report-header'><h1>Student Report - {student_name}</h1></div>"
+
+
+@lru_cache(maxsize=None)
+def _stylesheet(css):
+    """Parse a report stylesheet once per worker and reuse it for every PDF."""
+    from weasyprint import CSS
+    return CSS(string=css)
+
+
+# -------------------------------------------------------------------
+# Department report cell formatters, mapped over each column before to_html
+# (NaN cells are skipped by the map and rendered through na_rep)
+# -------------------------------------------------------------------
+def _format_text(value):
+    """Format a plain text cell, using '-' for empty values."""
+    if value == '':
+        return '-'
+    return str(value)
+
+
+def _format_number(value):
+    """Format a numeric cell without a trailing '.0' for whole numbers."""
+    if value == '':
+        return '-'
+    try:
+        fv = float(value)
+    except (ValueError, TypeError):
+        return str(value)
+    if fv != fv:  # NaN
+        return '-'
+    iv = int(fv)
+    return str(iv) if fv == iv else f"{fv:.1f}"
+
+
+def _format_percentage(value):
+    """Format a percentage cell with two decimals."""
+    if value == '':
+        return '-'
+    try:
+        if isinstance(value, (int, float)):
+            return f"{float(value):.2f}%"
+        elif isinstance(value, str) and '%' not in value:
+            return f"{float(value):.2f}%"
+        else:
+            return str(value)
+    except (ValueError, TypeError):
+        return str(value)
+
+
+_CELL_FORMATTERS = {
+    'Name': _format_text,
+    'Father Name': _format_text,
+    'Age': _format_number,
+    'Grade': _format_text,
+    'Total Marks': _format_number,
+    'Obtained Marks': _format_number,
+    'Percentage': _format_percentage,
+}
+
+
+# Students per rendered PDF chunk; keeps each layout pass small
+_ROWS_PER_CHUNK = 200
+
+
+def _department_sections(dept_name, frame):
+    """
+    Render a department title followed by its student table, split into
+    chunks of at most _ROWS_PER_CHUNK rows.
+    """
+    # Format up front: to_html(formatters=...) skips float cells held in
+    # object columns, which the empty-value fallbacks can produce
+    frame = frame.copy()
+    for col, formatter in _CELL_FORMATTERS.items():
+        frame[col] = frame[col].map(formatter, na_action='ignore')
+
+    return [
+        f"<div class='department-title'>Department: {escape(dept_name)}</div>"
+        + frame.iloc[start:start + _ROWS_PER_CHUNK].to_html(
+            index=False,
+            escape=True,
+            border=0,
+            classes='student-table',
+            na_rep='-',
+        )
+        for start in range(0, len(frame), _ROWS_PER_CHUNK)
+    ]
+
+
+# -------------------------------------------------------------------
+# Fields rendered by the single student report, read up front in one query
+# -------------------------------------------------------------------
+_STUDENT_REPORT_FIELDS = [
+    'name', 'father_name', 'age', 'gender', 'department_id', 'grade',
+    'total_marks', 'obtained_marks', 'percentage', 'about_education', 'write_date',
+]
+_EDUCATION_REPORT_FIELDS = ['institute', 'degree', 'passing_year', 'write_date']
+
+# -------------------------------------------------------------------
+# Single student report rows as (column, getter) pairs
+# -------------------------------------------------------------------
+_PERSONAL_GETTERS = [
+    ('Name', lambda s: s.name or '-'),
+    ('Father Name', lambda s: s.father_name or '-'),
+    ('Age', lambda s: s.age or '-'),
+    ('Gender', lambda s: _GENDER_MAP.get(s.gender, '-')),
+    ('Department', lambda s: s.department_id.name if s.department_id else '-'),
+    ('Grade', lambda s: s.grade or '-'),
+]
+
+_ACADEMIC_GETTERS = [
+    ('Total Marks', lambda s: s.total_marks or '-'),
+    ('Obtained Marks', lambda s: s.obtained_marks or '-'),
+    ('Percentage', lambda s: f"{s.percentage:.2f}%" if s.percentage else '0.00%'),
+]
+
+
+def _render_section(title, columns, rows, empty_message):
+    """Render a titled data table, or a single empty row when there is no data."""
+    head = "<tr>" + ''.join(f"<th>{col}</th>" for col in columns) + "</tr>"
+    if rows:
+        body = ''.join(
+            "<tr>" + ''.join(f"<td>{escape(str(v))}</td>" for v in row) + "</tr>"
+            for row in rows
+        )
+    else:
+        body = f"<tr class='empty-row'><td colspan='{len(columns)}'>{empty_message}</td></tr>"
+    return f"<h2 class='section-title'>{title}</h2><table class='data-table'>{head}{body}</table>"
 
 
 class StudentReport(models.AbstractModel):
@@ -11,20 +260,22 @@ class StudentReport(models.AbstractModel):
     _description = 'Student Reports (PDF Generation with Pandas)'
 
     @api.model
-    def print_department_report(self, department_id=None):
-        """Generate department-wise student PDF report using pandas."""
-
+    def print_department_report(self, department=None):
+        """
+        Generate department-wise student PDF report using pandas.
+        `department` is a department record; leave it empty for all students.
+        """
         Department = self.env['department']
         Student = self.env['student']
 
         # -------------------------------------------------------
         # 1️⃣ Get department(s)
         # -------------------------------------------------------
-        if not department_id:
+        if not department:
             departments = Department.search([])
             dept_name = "ALL"
         else:
-            departments = Department.browse(department_id)
+            departments = department
             dept_name = departments.name or "ALL"
 
         if not departments:
@@ -36,7 +287,25 @@ class StudentReport(models.AbstractModel):
         if dept_name == "ALL":
             students = Student.search([])
         else:
-            students = Student.search([('department_id', '=', department_id)])
+            # Stays in the caller's prefetch set, read in one batch below
+            students = department.student_ids
+
+        # Reuse a recent report rendered from the same student data. The key
+        # comes from a single aggregate query, so a hit reads no student rows.
+        # students holds real ids only (search or One2many), so _ids is safe.
+        attachment_name = f'Department_Report_{dept_name.replace(" ", "_")}.pdf'
+        [(student_count, last_write)] = Student._read_group(
+            [('id', 'in', students._ids)], aggregates=['__count', 'write_date:max'])
+        # Department names are printed too, so renaming one must invalidate
+        [(dept_write,)] = Department._read_group(
+            [('student_ids', 'in', students._ids)], aggregates=['write_date:max'])
+        cache_key = (
+            f"{department.id if department else 0}:{student_count}:"
+            f"{last_write or ''}:{dept_write or ''}"
+        )
+        attachment = self._get_cached_report(attachment_name, cache_key)
+        if attachment:
+            return self._download_action(attachment)
 
         # -------------------------------------------------------
         # 3️⃣ Define STANDARDIZED columns (CRITICAL FOR CONSISTENCY)
@@ -54,236 +323,221 @@ class StudentReport(models.AbstractModel):
         # -------------------------------------------------------
         # 4️⃣ Build DataFrame from student records with FALLBACK values
         # -------------------------------------------------------
-        data = []
-        if students:
-            for s in students:
-                data.append({
-                    'Department': s.department_id.name if s.department_id else 'No Department',
-                    'Name': s.name or '',
-                    'Father Name': s.father_name or '',
-                    'Age': s.age or '',
-                    'Grade': s.grade or '',
-                    'Total Marks': s.total_marks or '',
-                    'Obtained Marks': s.obtained_marks or '',
-                    'Percentage': s.percentage or 0.0,
-                })
-            df = pd.DataFrame(data)
+        FIELD_LABELS = {
+            'name': 'Name',
+            'father_name': 'Father Name',
+            'age': 'Age',
+            'grade': 'Grade',
+            'total_marks': 'Total Marks',
+            'obtained_marks': 'Obtained Marks',
+            'percentage': 'Percentage',
+        }
+
+        # Imported only once a report really has to be rendered, so cache
+        # hits never pay for loading pandas
+        import pandas as pd
+
+        # One read for the whole recordset; department_id comes back as (id, name)
+        rows = students.read(list(FIELD_LABELS) + ['department_id'])
+
+        if rows:
+            df = pd.DataFrame(rows).rename(columns=FIELD_LABELS)
+            df['Department'] = df['department_id'].str[1].fillna('No Department')
+
+            # Apply empty-value fallbacks column-wise in one pass
+            text_cols = [c for c in STANDARD_COLUMNS if c != 'Percentage']
+            df[text_cols] = df[text_cols].where(df[text_cols].astype(bool), '')
+            df['Percentage'] = df['Percentage'].fillna(0.0)
         else:
             # Create empty DataFrame with proper structure when no data
             df = pd.DataFrame(columns=['Department'] + STANDARD_COLUMNS)
 
         # -------------------------------------------------------
-        # 5️⃣ Generate HTML with ROBUST table structure
-        # -------------------------------------------------------
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    padding: 20px;
-                }}
-                .report-title {{
-                    text-align: center;
-                    font-size: 22px;
-                    font-weight: bold;
-                    margin-bottom: 15px;
-                    color: #2a2a2a;
-                }}
-                .department-title {{
-                    background-color: #555;
-                    color: white;
-                    padding: 8px;
-                    font-size: 16px;
-                    border-radius: 4px;
-                    margin-top: 20px;
-                    margin-bottom: 10px;
-                }}
-                .student-table {{
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin-bottom: 20px;
-                }}
-                .student-table th, .student-table td {{
-                    border: 1px solid #bbb;
-                    padding: 8px;
-                    text-align: center;
-                    font-size: 12px;
-                    min-width: 80px;
-                }}
-                .student-table th {{
-                    background-color: #333;
-                    color: white;
-                    font-weight: bold;
-                }}
-                .student-table td {{
-                    background-color: #f9f9f9;
-                }}
-                .no-data {{
-                    text-align: center;
-                    color: #666;
-                    font-style: italic;
-                    padding: 20px;
-                    background-color: #f0f0f0;
-                    border: 1px solid #ddd;
-                }}
-                .empty-row td {{
-                    background-color: #fff;
-                    color: #999;
-                    font-style: italic;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="report-title">Department Report - {dept_name}</div>
-        """
-
-        # -------------------------------------------------------
-        # 6️⃣ Handle both scenarios: With data and Without data
+        # 5️⃣ Generate HTML sections per department chunk
         # -------------------------------------------------------
         if df.empty:
             # Scenario 1: No data available - Show structured empty table
-            html += f"<div class='department-title'>Department: {dept_name}</div>"
-            html += "<table class='student-table'>"
-            
-            # Create table header
-            html += "<tr>"
-            for col in STANDARD_COLUMNS:
-                html += f"<th>{col}</th>"
-            html += "</tr>"
-            
-            # Show empty data message in proper table structure
-            html += f"""
-            <tr class='empty-row'>
-                <td colspan='{len(STANDARD_COLUMNS)}' class='no-data'>
-                    No student records found for this department
-                </td>
-            </tr>
-            """
-            html += "</table>"
-            
+            sections = [''.join([
+                f"<div class='department-title'>Department: {escape(dept_name)}</div>",
+                "<table class='student-table'><tr>",
+                *(f"<th>{col}</th>" for col in STANDARD_COLUMNS),
+                "</tr>",
+                f"<tr class='empty-row'><td colspan='{len(STANDARD_COLUMNS)}' class='no-data'>"
+                "No student records found for this department</td></tr>",
+                "</table>",
+            ])]
+
         else:
             # Scenario 2: Data available - Group by department
-            for dept_name, group in df.groupby('Department'):
-                html += f"<div class='department-title'>Department: {dept_name}</div>"
-                
-                # Create table with STANDARDIZED columns
-                html += "<table class='student-table'><tr>"
-                for col in STANDARD_COLUMNS:
-                    html += f"<th>{col}</th>"
-                html += "</tr>"
-
-                # Add student data with PROPER NULL HANDLING
-                if group.empty:
-                    # Empty department within non-empty dataset
-                    html += f"""
-                    <tr class='empty-row'>
-                        <td colspan='{len(STANDARD_COLUMNS)}' class='no-data'>
-                            No students in this department
-                        </td>
-                    </tr>
-                    """
-                else:
-                    for _, row in group.iterrows():
-                        html += "<tr>"
-                        for col in STANDARD_COLUMNS:
-                            value = self._format_cell_value(row, col)
-                            html += f"<td>{value}</td>"
-                        html += "</tr>"
-                html += "</table>"
-
-        html += "</body></html>"
+            if dept_name != "ALL":
+                # A single department needs no grouping
+                sections = _department_sections(dept_name, df[STANDARD_COLUMNS])
+            else:
+                sections = [
+                    section
+                    for group_name, group in df.groupby('Department')
+                    for section in _department_sections(group_name, group[STANDARD_COLUMNS])
+                ]
 
         # -------------------------------------------------------
-        # 7️⃣ Generate PDF
+        # 6️⃣ Generate PDF, laying out each section separately
         # -------------------------------------------------------
-        pdf_file = BytesIO()
-        try:
-            pisa_status = pisa.CreatePDF(html, dest=pdf_file)
-            if pisa_status.err:
-                raise UserError(f"PDF generation error: {pisa_status.err}")
-            pdf_data = pdf_file.getvalue()
-        except Exception as e:
-            raise UserError(f"PDF creation failed: {str(e)}")
-        finally:
-            pdf_file.close()
+        title = _DEPARTMENT_REPORT_TITLE.format(dept_name=escape(dept_name))
+        documents = [
+            _REPORT_HEAD + (title if index == 0 else '') + section + "</body></html>"
+            for index, section in enumerate(sections)
+        ]
+        pdf_data = self._render_pdf(documents, _DEPARTMENT_REPORT_CSS)
 
         # -------------------------------------------------------
-        # 8️⃣ Create attachment and return download action
+        # 7️⃣ Create attachment and return download action
         # -------------------------------------------------------
         attachment = self.env['ir.attachment'].create({
-            'name': f'Department_Report_{dept_name.replace(" ", "_")}.pdf',
+            'name': attachment_name,
             'type': 'binary',
-            'datas': base64.b64encode(pdf_data).decode('utf-8'),
+            'raw': pdf_data,
             'mimetype': 'application/pdf',
             'res_model': 'student',
             'res_id': 0,
+            'description': cache_key,
         })
 
+        return self._download_action(attachment)
+
+    def _get_cached_report(self, name, cache_key):
+        """
+        Return the report attachment rendered for cache_key within the last
+        'student_reports.report_cache_ttl' seconds (default 60), if any.
+        """
+        ttl = int(self.env['ir.config_parameter'].sudo().get_param(
+            'student_reports.report_cache_ttl', 60))
+        if ttl <= 0:
+            return self.env['ir.attachment']
+        return self.env['ir.attachment'].search([
+            ('name', '=', name),
+            ('res_model', '=', 'student'),
+            ('description', '=', cache_key),
+            ('create_date', '>=', fields.Datetime.now() - timedelta(seconds=ttl)),
+        ], order='create_date desc', limit=1)
+
+    def _download_action(self, attachment):
+        """Return the action downloading the given report attachment."""
         return {
             'type': 'ir.actions.act_url',
             'url': f"/web/content/{attachment.id}?download=true",
             'target': 'self',
         }
 
-    def _format_cell_value(self, row, column_name):
+    def _render_pdf(self, documents, css):
         """
-        Format cell values consistently to prevent misalignment
+        Render HTML documents styled with css into one PDF. Each document is
+        laid out on its own, so only one layout tree is held in memory at a
+        time, and the resulting pages are concatenated.
         """
-        value = row[column_name]
-        
-        # Handle None/NaN values
-        if pd.isna(value) or value is None or value == '':
-            return '-'  # Consistent placeholder for empty values
-        
-        # Format percentage values
-        if column_name == 'Percentage':
-            try:
-                if isinstance(value, (int, float)):
-                    return f"{float(value):.2f}%"
-                elif isinstance(value, str) and '%' not in value:
-                    return f"{float(value):.2f}%"
-                else:
-                    return str(value)
-            except (ValueError, TypeError):
-                return str(value)
-        
-        # Format numeric values
-        if column_name in ['Age', 'Total Marks', 'Obtained Marks']:
-            try:
-                if isinstance(value, (int, float)):
-                    return f"{float(value):.1f}" if float(value) != int(value) else f"{int(value)}"
-            except (ValueError, TypeError):
-                pass
-        
-        return str(value)
+        # Imported on first use: WeasyPrint pulls in a large parsing and
+        # layout stack that workers never generating reports don't need
+        from weasyprint import HTML
+
+        try:
+            stylesheets = [_stylesheet(css)]
+            if len(documents) == 1:
+                return HTML(string=documents[0]).write_pdf(stylesheets=stylesheets)
+            return merge_pdf([
+                HTML(string=html).write_pdf(stylesheets=stylesheets) for html in documents
+            ])
+        except Exception as e:
+            raise UserError(f"PDF creation failed: {str(e)}")
 
     # SINGLE STUDENT REPORT
     # -------------------------------------------------------------
     def generate_single_student_report(self, student):
         """Generate a PDF for one student record with standardized columns."""
-        
+
+        # -------------------------------------------------------
+        # 1️⃣ Load all rendered data up front
+        # -------------------------------------------------------
+        self._prefetch_student_report_data(student)
+
+        # Reuse a recent report if nothing it shows has changed since
+        attachment_name = f'{student.name or "Student"}_Report.pdf'
+        cache_key = f"{student.id}:{self._student_report_epoch(student)}"
+        attachment = self._get_cached_report(attachment_name, cache_key)
+        if attachment:
+            return self._download_action(attachment)
+
+        # -------------------------------------------------------
+        # 2️⃣ Generate PDF
+        # -------------------------------------------------------
+        pdf_data = self._render_pdf([self._student_report_html(student)], _STUDENT_REPORT_CSS)
+
+        # -------------------------------------------------------
+        # 3️⃣ Save attachment
+        # -------------------------------------------------------
+        attachment = student.env['ir.attachment'].create({
+            'name': attachment_name,
+            'type': 'binary',
+            'raw': pdf_data,
+            'res_model': 'student',
+            'res_id': student.id,
+            'mimetype': 'application/pdf',
+            'description': cache_key,
+        })
+
+        return self._download_action(attachment)
+
+    # MULTIPLE STUDENT REPORT
+    # -------------------------------------------------------------
+    @api.model
+    def generate_reports(self, students):
+        """Generate one PDF holding the student report of every given student."""
+        if not students:
+            raise UserError("No students selected.")
+
+        # Batch-load the data of all students before rendering any of them
+        self._prefetch_student_report_data(students)
+        pdf_data = self._render_pdf(
+            [self._student_report_html(student) for student in students],
+            _STUDENT_REPORT_CSS,
+        )
+
+        attachment = self.env['ir.attachment'].create({
+            'name': 'Student_Reports.pdf',
+            'type': 'binary',
+            'raw': pdf_data,
+            'mimetype': 'application/pdf',
+            'res_model': 'student',
+            'res_id': 0,
+        })
+
+        return self._download_action(attachment)
+
+    def _prefetch_student_report_data(self, students):
+        """Read everything the student report renders, one query per model."""
+        # Load only the rendered fields, skipping e.g. the address text
+        students.read(_STUDENT_REPORT_FIELDS)
+        students.mapped('department_id.name')
+
+        educations = students.about_education
+        educations.read(_EDUCATION_REPORT_FIELDS)
+        educations.mapped('institute.name')
+        educations.mapped('degree.name')
+
+    def _student_report_epoch(self, student):
+        """Latest write_date among the records shown in a student's report."""
+        educations = student.about_education
+        rendered = [student, student.department_id, educations, educations.institute, educations.degree]
+        return max(
+            (date for records in rendered for date in records.mapped('write_date') if date),
+            default='',
+        )
+
+    def _student_report_html(self, student):
+        """Build the HTML document of one student's report."""
+
         # -------------------------------------------------------
         # 1️⃣ Define STANDARDIZED COLUMNS for consistent structure
         # -------------------------------------------------------
-        
-        # Personal Information Standard Columns
-        PERSONAL_INFO_COLUMNS = [
-            'Name', 
-            'Father Name', 
-            'Age', 
-            'Gender', 
-            'Department', 
-            'Grade'
-        ]
-        
-        # Academic Information Standard Columns  
-        ACADEMIC_INFO_COLUMNS = [
-            'Total Marks',
-            'Obtained Marks', 
-            'Percentage'
-        ]
-        
+
         # Education History Standard Columns
         EDUCATION_COLUMNS = [
             'Institute',
@@ -294,215 +548,48 @@ class StudentReport(models.AbstractModel):
         # -------------------------------------------------------
         # 2️⃣ Build Personal Information Data with STANDARD columns
         # -------------------------------------------------------
-        personal_data = []
-        personal_row = {}
-        
-        # Map all available data, but we'll display only STANDARD columns
-        all_personal_data = {
-            'Name': student.name or '-',
-            'Father Name': student.father_name or '-',
-            'Age': student.age or '-',
-            'Gender': dict(student._fields['gender'].selection).get(student.gender, '-'),
-            'Department': student.department_id.name if student.department_id else '-',
-            'Grade': student.grade or '-',
-            'Total Marks': student.total_marks or '-',
-            'Obtained Marks': student.obtained_marks or '-',
-            'Percentage': f"{student.percentage:.2f}%" if student.percentage else '0.00%',
-            'Address': student.address or '-'
-        }
-        
-        # Only include STANDARD columns in the display
-        for col in PERSONAL_INFO_COLUMNS:
-            personal_row[col] = all_personal_data.get(col, '-')
-        
-        personal_data.append(personal_row)
-        df_personal = pd.DataFrame(personal_data)
+        personal_rows = [[getter(student) for _, getter in _PERSONAL_GETTERS]]
 
         # -------------------------------------------------------
         # 3️⃣ Build Academic Information Data with STANDARD columns
         # -------------------------------------------------------
-        academic_data = []
-        academic_row = {}
-        
-        for col in ACADEMIC_INFO_COLUMNS:
-            academic_row[col] = all_personal_data.get(col, '-')
-        
-        academic_data.append(academic_row)
-        df_academic = pd.DataFrame(academic_data)
+        academic_rows = [[getter(student) for _, getter in _ACADEMIC_GETTERS]]
 
         # -------------------------------------------------------
         # 4️⃣ Build Education Data with STANDARD columns
         # -------------------------------------------------------
-        education_data = []
-        for edu in student.about_education:
-            edu_row = {}
-            edu_row['Institute'] = edu.institute.name if edu.institute else '-'
-            edu_row['Degree'] = edu.degree.name if edu.degree else '-'
-            edu_row['Passing Year'] = edu.passing_year or '-'
-            education_data.append(edu_row)
-        
-        # Create empty DataFrame with standard columns if no education data
-        if not education_data:
-            df_education = pd.DataFrame(columns=EDUCATION_COLUMNS)
-        else:
-            df_education = pd.DataFrame(education_data)
+        education_rows = [
+            (
+                edu.institute.name if edu.institute else '-',
+                edu.degree.name if edu.degree else '-',
+                edu.passing_year or '-',
+            )
+            for edu in student.about_education
+        ]
 
         # -------------------------------------------------------
         # 5️⃣ Generate HTML with STANDARDIZED table structure
         # -------------------------------------------------------
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{ 
-                    font-family: Arial, sans-serif; 
-                    background-color: #f9f9f9; 
-                    margin: 20px; 
-                }}
-                .report-header {{ 
-                    text-align: center; 
-                    background-color: #4a4a4a; 
-                    color: white; 
-                    padding: 15px; 
-                    border-radius: 8px;
-                    margin-bottom: 20px;
-                }}
-                .section-title {{ 
-                    color: #333; 
-                    border-bottom: 2px solid #ddd; 
-                    margin-top: 30px;
-                    padding-bottom: 5px;
-                }}
-                .data-table {{ 
-                    width: 100%; 
-                    border-collapse: collapse; 
-                    background-color: white; 
-                    margin-bottom: 20px;
-                    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-                }}
-                .data-table th, .data-table td {{ 
-                    border: 1px solid #ddd; 
-                    padding: 12px; 
-                    text-align: left; 
-                }}
-                .data-table th {{ 
-                    background-color: #4a4a4a; 
-                    color: white;
-                    font-weight: bold;
-                }}
-                .data-table td {{
-                    background-color: #fafafa;
-                }}
-                .no-data {{ 
-                    text-align: center; 
-                    color: #666; 
-                    font-style: italic; 
-                    padding: 20px;
-                    background-color: #f0f0f0;
-                    border: 1px solid #ddd;
-                }}
-                .empty-row td {{
-                    background-color: #fff;
-                    color: #999;
-                    font-style: italic;
-                    text-align: center;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="report-header">
-                <h1>Student Report - {student.name or 'Unknown Student'}</h1>
-            </div>
-            
-            <h2 class="section-title">Personal Information</h2>
-        """
-        
-        # Personal Information Table
-        html += "<table class='data-table'>"
-        html += "<tr>"
-        for col in PERSONAL_INFO_COLUMNS:
-            html += f"<th>{col}</th>"
-        html += "</tr>"
-        
-        if not df_personal.empty:
-            for _, row in df_personal.iterrows():
-                html += "<tr>"
-                for col in PERSONAL_INFO_COLUMNS:
-                    value = row[col] if pd.notna(row[col]) else '-'
-                    html += f"<td>{value}</td>"
-                html += "</tr>"
-        else:
-            html += f"<tr class='empty-row'><td colspan='{len(PERSONAL_INFO_COLUMNS)}'>No personal information available</td></tr>"
-        html += "</table>"
-        
-        # Academic Information Table
-        html += "<h2 class='section-title'>Academic Performance</h2>"
-        html += "<table class='data-table'>"
-        html += "<tr>"
-        for col in ACADEMIC_INFO_COLUMNS:
-            html += f"<th>{col}</th>"
-        html += "</tr>"
-        
-        if not df_academic.empty:
-            for _, row in df_academic.iterrows():
-                html += "<tr>"
-                for col in ACADEMIC_INFO_COLUMNS:
-                    value = row[col] if pd.notna(row[col]) else '-'
-                    html += f"<td>{value}</td>"
-                html += "</tr>"
-        else:
-            html += f"<tr class='empty-row'><td colspan='{len(ACADEMIC_INFO_COLUMNS)}'>No academic information available</td></tr>"
-        html += "</table>"
-        
-        # Education History Table
-        html += "<h2 class='section-title'>Education History</h2>"
-        html += "<table class='data-table'>"
-        html += "<tr>"
-        for col in EDUCATION_COLUMNS:
-            html += f"<th>{col}</th>"
-        html += "</tr>"
-        
-        if not df_education.empty:
-            for _, row in df_education.iterrows():
-                html += "<tr>"
-                for col in EDUCATION_COLUMNS:
-                    value = row[col] if pd.notna(row[col]) else '-'
-                    html += f"<td>{value}</td>"
-                html += "</tr>"
-        else:
-            html += f"<tr class='empty-row'><td colspan='{len(EDUCATION_COLUMNS)}'>No education history available</td></tr>"
-        html += "</table>"
-        
-        html += "</body></html>"
-
-        # -------------------------------------------------------
-        # 6️⃣ Generate PDF
-        # -------------------------------------------------------
-        pdf_file = BytesIO()
-        try:
-            pisa_status = pisa.CreatePDF(html, dest=pdf_file)
-            if pisa_status.err:
-                raise UserError(f"PDF generation error: {pisa_status.err}")
-            pdf_data = pdf_file.getvalue()
-        except Exception as e:
-            raise UserError(f"PDF creation failed: {str(e)}")
-        finally:
-            pdf_file.close()
-
-        # -------------------------------------------------------
-        # 7️⃣ Save attachment
-        # -------------------------------------------------------
-        attachment = student.env['ir.attachment'].create({
-            'name': f'{student.name or "Student"}_Report.pdf',
-            'type': 'binary',
-            'datas': base64.b64encode(pdf_data),
-            'res_model': 'student',
-            'res_id': student.id,
-            'mimetype': 'application/pdf',
-        })
-
-        return {
-            'type': 'ir.actions.act_url',
-            'url': f"/web/content/{attachment.id}?download=true",
-            'target': 'self',
-        }
\ No newline at end of file
+        return ''.join([
+            _REPORT_HEAD,
+            _STUDENT_REPORT_TITLE.format(student_name=escape(student.name or 'Unknown Student')),
+            _render_section(
+                'Personal Information',
+                [col for col, _ in _PERSONAL_GETTERS],
+                personal_rows,
+                'No personal information available',
+            ),
+            _render_section(
+                'Academic Performance',
+                [col for col, _ in _ACADEMIC_GETTERS],
+                academic_rows,
+                'No academic information available',
+            ),
+            _render_section(
+                'Education History',
+                EDUCATION_COLUMNS,
+                education_rows,
+                'No education history available',
+            ),
+            "</body></html>",
+        ])
@@ -2,6 +2,15 @@ from odoo import models, fields, api
 from odoo.exceptions import UserError
 
 
+# report_type -> (wizard field holding the report target, report method,
+#                 message shown when that field is empty)
+_DISPATCH = {
+    'single': ('student_id', 'generate_single_student_report', "Please select a student."),
+    'department': ('department_id', 'print_department_report', "Please select a department."),
+    'multiple': ('report_student_ids', 'generate_reports', "Please select students or departments."),
+}
+
+
 class StudentReportWizard(models.TransientModel):
     _name = 'student.report.wizard'
     _description = 'Student Report Wizard'
@@ -9,10 +18,24 @@ class StudentReportWizard(models.TransientModel):
     report_type = fields.Selection([
         ('single', 'Single Student'),
         ('department', 'Department Wise'),
+        ('multiple', 'Multiple Students'),
     ], string='Report Type', required=True, default='single')
 
-    student_id = fields.Many2one('student', string='Student')
-    department_id = fields.Many2one('department', string='Department')
+    student_id = fields.Many2one('student', string='Student', index=True, ondelete='cascade')
+    department_id = fields.Many2one('department', string='Department', index=True, ondelete='cascade')
+    student_ids = fields.Many2many('student', string='Students')
+    department_ids = fields.Many2many('department', string='Departments')
+    report_student_ids = fields.Many2many(
+        'student',
+        string='Report Students',
+        compute='_compute_report_student_ids',
+    )
+
+    @api.depends('student_ids', 'department_ids.student_ids')
+    def _compute_report_student_ids(self):
+        """Students covered by a multiple-student report."""
+        for wizard in self:
+            wizard.report_student_ids = wizard.student_ids | wizard.department_ids.student_ids
 
     # -------------------------------------------------------
     # Main Action Method
@@ -21,32 +44,14 @@ class StudentReportWizard(models.TransientModel):
         """Generate report based on selected type."""
         self.ensure_one()
 
-        report_model = self.env['report.student_reports']
-
-        # -------------------------
-        # SINGLE STUDENT REPORT
-        # -------------------------
-        if self.report_type == 'single':
-            if not self.student_id:
-                raise UserError("Please select a student.")
-            try:
-                return report_model.generate_single_student_report(self.student_id)
-            except Exception as e:
-                raise UserError(f"Error generating single student report:\n{str(e)}")
-
-        # -------------------------
-        # DEPARTMENT REPORT
-        # -------------------------
-        elif self.report_type == 'department':
-            if not self.department_id:
-                raise UserError("Please select a department.")
-            try:
-                return report_model.print_department_report(self.department_id.id)
-            except Exception as e:
-                raise UserError(f"Error generating department report:\n{str(e)}")
-
-        # -------------------------
-        # SAFETY CATCH
-        # -------------------------
-        else:
+        if self.report_type not in _DISPATCH:
             raise UserError("Invalid report type selected.")
+        field_name, method_name, missing_message = _DISPATCH[self.report_type]
+
+        # Every report method takes its target recordset as sole argument.
+        # Report errors propagate as-is; they are already UserErrors or real
+        # failures whose traceback should reach the logs.
+        target = self[field_name]
+        if not target:
+            raise UserError(missing_message)
+        return getattr(self.env['report.student_reports'], method_name)(target)